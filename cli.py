@@ -0,0 +1,244 @@
+"""
+This module is a single command line entry point for the three pipelines:
+log parsing (test_1), court matching (test_2) and time summing (test_3).
+Any pipeline can be profiled with the --profile, --trace-malloc and --timing
+options without having to modify the modules themselves.
+
+Example:
+    python3 cli.py --profile --timing logs sample.log
+"""
+import argparse
+import cProfile
+import heapq
+import pstats
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from operator import itemgetter
+from typing import Callable, Iterator, Optional
+
+from test_1 import parse_log_line
+from test_3 import sum_current_time
+
+
+def parse_log_file(log_file: str, as_dict: bool = True) -> Iterator:
+    """
+    Yields the valid lines of a log file one at a time, converted into
+    dictionaries with parse_log_line unless as_dict is False.
+
+    Args:
+        log_file (str): The path to the log file.
+        as_dict (bool): Whether to yield dictionaries instead of raw lines.
+    """
+    with open(log_file, encoding="utf-8") as file:
+        for line in file:
+            parsed = parse_log_line(line)
+            if parsed is not None:
+                yield parsed[1] if as_dict else line
+
+
+def tag_log_file(log_file: str) -> Iterator[tuple[datetime, dict]]:
+    """
+    Yields (timestamp, dict) pairs for the valid lines of a log file, with a
+    `source` key set to the file path on each dict. Raises a ValueError if
+    a timestamp is earlier than the one before it, as the merge relies on
+    each file being in time order.
+
+    Args:
+        log_file (str): The path to the log file.
+    """
+    last_timestamp, last_record = None, None
+    with open(log_file, encoding="utf-8") as file:
+        for line_number, line in enumerate(file, start=1):
+            parsed = parse_log_line(line)
+            if parsed is None:
+                continue
+            timestamp, record = parsed
+            if last_timestamp is not None and timestamp < last_timestamp:
+                raise ValueError(
+                    f"Log file '{log_file}' is not in time order at line "
+                    f"{line_number}: {record['timestamp']} is earlier than "
+                    f"{last_record['timestamp']}."
+                )
+            last_timestamp, last_record = timestamp, record
+            record["source"] = log_file
+            yield parsed
+
+
+def merge_log_files(log_files: list[str]) -> Iterator[dict]:
+    """
+    Yields the dicts of several log files as one stream ordered by timestamp.
+    Each file is read lazily and only its current record is held in the heap,
+    so memory stays proportional to the number of files. Each file must already
+    be in time order, otherwise a ValueError is raised when the merge reaches
+    the out of order line. Records with equal timestamps keep their order
+    within a file, and files earlier in log_files come first.
+
+    Args:
+        log_files (list[str]): The paths to the log files.
+    """
+    merged = heapq.merge(*map(tag_log_file, log_files), key=itemgetter(0))
+    return (record for _, record in merged)
+
+
+def run_logs(args: argparse.Namespace) -> None:
+    """
+    Prints every valid line of the log file (step 1), or the dicts of the
+    log files merged into one stream ordered by timestamp (step 2). Every
+    dict has a `source` key, even when there is only one log file.
+    """
+    if args.step == 1:
+        for line in parse_log_file(args.log_files[0], as_dict=False):
+            sys.stdout.write(line)
+        return
+
+    for record in merge_log_files(args.log_files):
+        sys.stdout.write(f"{record}\n")
+
+
+def run_courts(args: argparse.Namespace) -> None:
+    """Prints the nearest court of the desired type for each person in the CSV."""
+    # Imported here so the other subcommands do not need pandas or requests.
+    # main has already imported test_2, so this import is not profiled.
+    from test_2 import csv_exists, get_csv_dict, process_people_data
+
+    csv_exists(args.csv_file)
+    print(process_people_data(get_csv_dict(args.csv_file)))
+
+
+def run_time(args: argparse.Namespace) -> None:
+    """Prints the sum of the components of each HH:MM:SS time given."""
+    for time_str in args.times:
+        print(sum_current_time(time_str))
+
+
+def run_profiled(func: Callable, args: argparse.Namespace) -> None:
+    """
+    Runs a subcommand, wrapping it in whichever of cProfile, tracemalloc
+    and a wall clock timer were requested. Reports are written to stderr
+    so they do not get mixed up with the pipeline output on stdout.
+
+    Args:
+        func (Callable): The subcommand function to run.
+        args (argparse.Namespace): The parsed command line arguments.
+    """
+    profiler = cProfile.Profile() if args.profile or args.profile_output else None
+
+    if args.trace_malloc:
+        tracemalloc.start()
+    start = time.perf_counter()
+    if profiler:
+        profiler.enable()
+
+    try:
+        func(args)
+    finally:
+        if profiler:
+            profiler.disable()
+        elapsed = time.perf_counter() - start
+
+        if args.trace_malloc:
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"Memory: current {current / 1024:.1f} KiB, "
+                f"peak {peak / 1024:.1f} KiB",
+                file=sys.stderr,
+            )
+
+        if profiler:
+            if args.profile_output:
+                profiler.dump_stats(args.profile_output)
+                print(f"Profile written to {args.profile_output}", file=sys.stderr)
+            else:
+                stats = pstats.Stats(profiler, stream=sys.stderr)
+                stats.sort_stats(args.profile_sort).print_stats(args.profile_limit)
+
+        if args.timing:
+            print(f"Elapsed: {elapsed:.6f}s", file=sys.stderr)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Returns the argument parser for the command line interface."""
+    parser = argparse.ArgumentParser(
+        description="Run the log parsing, court matching or time summing pipeline."
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="profile the run with cProfile"
+    )
+    parser.add_argument(
+        "--profile-output",
+        metavar="FILE",
+        help="save the raw profile to FILE instead of printing the stats",
+    )
+    parser.add_argument(
+        "--profile-sort",
+        default="cumulative",
+        choices=[key.value for key in pstats.SortKey],
+        help="pstats sort key used when printing the profile (default: cumulative)",
+    )
+    parser.add_argument(
+        "--profile-limit",
+        type=int,
+        default=20,
+        help="number of functions to print in the profile (default: 20)",
+    )
+    parser.add_argument(
+        "--trace-malloc",
+        action="store_true",
+        help="report current and peak memory allocated with tracemalloc",
+    )
+    parser.add_argument(
+        "--timing",
+        action="store_true",
+        help="report the wall clock run time; this includes the overhead of "
+        "--profile and --trace-malloc when they are also used",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    logs = subparsers.add_parser(
+        "logs",
+        help="parse a log file, or merge several time-ordered ones by timestamp",
+    )
+    logs.add_argument("log_files", nargs="*", default=["sample.log"])
+    logs.add_argument(
+        "--step",
+        type=int,
+        choices=(1, 2),
+        default=2,
+        help="1 prints the valid lines of a single log file, 2 prints the "
+        "dicts of all the log files with their source (default: 2)",
+    )
+    logs.set_defaults(func=run_logs)
+
+    courts = subparsers.add_parser("courts", help="find each person's nearest court")
+    courts.add_argument("csv_file", nargs="?", default="people.csv")
+    courts.set_defaults(func=run_courts)
+
+    times = subparsers.add_parser("time", help="sum the components of HH:MM:SS times")
+    times.add_argument("times", nargs="+", metavar="HH:MM:SS")
+    times.set_defaults(func=run_time)
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """main function to parse the arguments and run the chosen pipeline."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "logs" and args.step == 1 and len(args.log_files) > 1:
+        parser.error("--step 1 can only be used with a single log file")
+    if args.command == "courts":
+        # Import pandas and requests before profiling starts, so the reports
+        # measure the court matching rather than the imports.
+        import test_2  # pylint: disable=import-outside-toplevel,unused-import
+    try:
+        run_profiled(args.func, args)
+    except (OSError, ValueError) as exc:
+        parser.exit(1, f"{parser.prog}: error: {exc}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,9 @@ Then return it as a dictionary. As well as contains tests for these
 functions.
 """
 from datetime import datetime
+from typing import Optional
+
+TIMESTAMP_FORMAT = "%m/%d/%y %H:%M:%S"
 
 # [TODO]: step 1
 # Update the is_log_line function below to skip lines that are not valid log lines.
@@ -18,25 +21,41 @@ def is_valid_timestamp(timestamp: str) -> bool:
     """
     Returns True if valid timestamp. Else it return False.
     """
-    date_format = "%m/%d/%y %H:%M:%S"
-
     try:
         # Attempt to parse the timestamp using the specified format
-        datetime.strptime(timestamp, date_format)
+        datetime.strptime(timestamp, TIMESTAMP_FORMAT)
         return True
     except ValueError:
         # If the timestamp doesn't match the format, it's invalid
         return False
 
 
+def parse_log_line(line: str) -> Optional[tuple[datetime, dict]]:
+    """
+    Returns the parsed timestamp and the dict of a log line, or None if it is
+    not a valid log line. The timestamp is only parsed once, so callers can
+    reuse it (e.g. to order log lines) without parsing it again.
+    """
+    try:
+        timestamp = datetime.strptime(line[:17], TIMESTAMP_FORMAT)
+    except ValueError:
+        return None
+    if not line[17:26] or line[26:27] != ":":
+        return None
+    record = {
+        "timestamp": line[:17],
+        "log_level": line[17:26].strip(),
+        "message": line[26:].strip(),
+    }
+    return timestamp, record
+
+
 def is_log_line(line:str) -> str:
     """Takes a log line and returns it if it is a valid log line and returns nothing
     if it is not.
     """
-    if is_valid_timestamp(line[:17]):
-        if line[17:26]:
-            if line[26] == ":" and line[26:]:
-                return line
+    if parse_log_line(line) is not None:
+        return line
     return None
 
 
@@ -50,18 +69,10 @@ def get_dict(line: str) -> dict:
     """Takes a log line and returns a dict with
     `timestamp`, `log_level`, `message` keys
     """
-    valid_dict = {}
-
-    valid_log = is_log_line(line)
-    if valid_log:
-        valid_dict["timestamp"] = line[:17]
-    error = valid_log[17:26]
-    if error != " ":
-        valid_dict["log_level"] = error.strip()
-    message = valid_log[26:]
-    if message:
-        valid_dict["message"] = message.strip()
-    return valid_dict
+    parsed = parse_log_line(line)
+    if parsed is None:
+        return {}
+    return parsed[1]
 
 
 # YOU DON'T NEED TO CHANGE ANYTHING BELOW THIS LINE
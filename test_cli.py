@@ -0,0 +1,293 @@
+import io
+import os
+import pstats
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
+from cli import main, merge_log_files, parse_log_file
+
+
+class TestParseLogFile(unittest.TestCase):
+    def test_parse_log_file_lines(self):
+        with open("tests/step1.log") as f:
+            expected = f.readlines()
+
+        self.assertEqual(list(parse_log_file("sample.log", as_dict=False)), expected)
+
+    def test_parse_log_file_dicts(self):
+        expected = {
+            "timestamp": "03/11/21 08:51:01",
+            "log_level": "INFO",
+            "message": ":.main: *************** RSVP Agent started ***************",
+        }
+
+        self.assertEqual(next(parse_log_file("sample.log")), expected)
+
+
+class LogFileMixin:
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def write_log(self, name, lines):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, "w") as f:
+            f.writelines(lines)
+        return path
+
+
+class TestMergeLogFiles(LogFileMixin, unittest.TestCase):
+    def test_merge_log_files_ordered_by_timestamp(self):
+        host_a = self.write_log(
+            "a.log",
+            [
+                "03/11/21 08:51:01 INFO    :.main: a1\n",
+                " 02 \n",
+                "03/11/21 08:51:05 INFO    :.main: a2\n",
+            ],
+        )
+        host_b = self.write_log(
+            "b.log",
+            [
+                "03/11/21 08:51:03 TRACE   :.main: b1\n",
+                "04/11/21 08:51:00 WARNING :.main: b2\n",
+            ],
+        )
+
+        result = [
+            (record["message"], record["source"])
+            for record in merge_log_files([host_a, host_b])
+        ]
+
+        expected = [
+            (":.main: a1", host_a),
+            (":.main: b1", host_b),
+            (":.main: a2", host_a),
+            (":.main: b2", host_b),
+        ]
+        self.assertEqual(result, expected)
+
+    def test_merge_log_files_out_of_order_file(self):
+        host_a = self.write_log(
+            "a.log",
+            [
+                "03/11/21 08:51:05 INFO    :.main: a1\n",
+                " 02 \n",
+                "03/11/21 08:51:01 INFO    :.main: a2\n",
+            ],
+        )
+
+        with self.assertRaisesRegex(ValueError, "a.log.*line 3"):
+            list(merge_log_files([host_a]))
+
+    def test_merge_log_files_ties_are_stable(self):
+        host_a = self.write_log(
+            "a.log",
+            [
+                "03/11/21 08:51:01 INFO    :.main: a1\n",
+                "03/11/21 08:51:01 INFO    :.main: a2\n",
+            ],
+        )
+        host_b = self.write_log("b.log", ["03/11/21 08:51:01 INFO    :.main: b1\n"])
+
+        result = [record["message"] for record in merge_log_files([host_b, host_a])]
+
+        self.assertEqual(result, [":.main: b1", ":.main: a1", ":.main: a2"])
+
+    def test_merge_log_files_empty_file(self):
+        empty = self.write_log("empty.log", [])
+
+        result = list(merge_log_files([empty, "sample.log"]))
+
+        self.assertEqual(len(result), len(list(parse_log_file("sample.log"))))
+        self.assertTrue(all(record["source"] == "sample.log" for record in result))
+
+
+class TestMain(LogFileMixin, unittest.TestCase):
+    def run_main(self, argv):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            main(argv)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_time_subcommand(self):
+        stdout, stderr = self.run_main(["time", "01:02:03", "12:34:56"])
+
+        self.assertEqual(stdout, "6\n102\n")
+        self.assertEqual(stderr, "")
+
+    @patch("test_2.process_people_data")
+    @patch("test_2.get_csv_dict")
+    def test_courts_subcommand(self, mock_get_csv_dict, mock_process_people_data):
+        people = [
+            {
+                "person_name": "John Doe",
+                "home_postcode": "E144PU",
+                "looking_for_court_type": "Tribunal",
+            }
+        ]
+        output = [{"name": "John Doe", "nearest_court": "Court 1"}]
+        mock_get_csv_dict.return_value = people
+        mock_process_people_data.return_value = output
+
+        stdout, _ = self.run_main(["courts", "people.csv"])
+
+        self.assertEqual(stdout, f"{output}\n")
+        mock_get_csv_dict.assert_called_once_with("people.csv")
+        mock_process_people_data.assert_called_once_with(people)
+
+    def test_logs_step_1(self):
+        with open("tests/step1.log") as f:
+            expected = f.read()
+
+        stdout, _ = self.run_main(["logs", "sample.log", "--step", "1"])
+
+        self.assertEqual(stdout, expected)
+
+    def test_logs_merges_multiple_files(self):
+        host_a = self.write_log(
+            "a.log",
+            [
+                "03/11/21 08:51:01 INFO    :.main: a1\n",
+                "03/11/21 08:51:05 INFO    :.main: a2\n",
+            ],
+        )
+        host_b = self.write_log(
+            "b.log",
+            [
+                "03/11/21 08:51:03 TRACE   :.main: b1\n",
+                "03/11/21 08:51:07 WARNING :.main: b2\n",
+            ],
+        )
+
+        stdout, _ = self.run_main(["logs", host_a, host_b])
+
+        expected = [
+            {
+                "timestamp": "03/11/21 08:51:01",
+                "log_level": "INFO",
+                "message": ":.main: a1",
+                "source": host_a,
+            },
+            {
+                "timestamp": "03/11/21 08:51:03",
+                "log_level": "TRACE",
+                "message": ":.main: b1",
+                "source": host_b,
+            },
+            {
+                "timestamp": "03/11/21 08:51:05",
+                "log_level": "INFO",
+                "message": ":.main: a2",
+                "source": host_a,
+            },
+            {
+                "timestamp": "03/11/21 08:51:07",
+                "log_level": "WARNING",
+                "message": ":.main: b2",
+                "source": host_b,
+            },
+        ]
+        self.assertEqual(stdout.splitlines(), [str(record) for record in expected])
+
+    def test_logs_single_file_has_source(self):
+        host_a = self.write_log(
+            "a.log",
+            [
+                "03/11/21 08:51:01 INFO    :.main: a1\n",
+                "03/11/21 08:51:05 INFO    :.main: a2\n",
+            ],
+        )
+
+        stdout, _ = self.run_main(["logs", host_a])
+
+        expected = [
+            {
+                "timestamp": "03/11/21 08:51:01",
+                "log_level": "INFO",
+                "message": ":.main: a1",
+                "source": host_a,
+            },
+            {
+                "timestamp": "03/11/21 08:51:05",
+                "log_level": "INFO",
+                "message": ":.main: a2",
+                "source": host_a,
+            },
+        ]
+        self.assertEqual(stdout.splitlines(), [str(record) for record in expected])
+
+    def test_logs_step_1_rejects_multiple_files(self):
+        with self.assertRaises(SystemExit):
+            self.run_main(["logs", "sample.log", "sample.log", "--step", "1"])
+
+    def test_missing_log_file_exits_cleanly(self):
+        missing = os.path.join(self.tmp_dir.name, "missing.log")
+
+        with self.assertRaises(SystemExit) as context:
+            self.run_main(["logs", missing])
+
+        self.assertEqual(context.exception.code, 1)
+
+    def test_out_of_order_log_file_exits_cleanly(self):
+        host_a = self.write_log(
+            "a.log",
+            [
+                "03/11/21 08:51:05 INFO    :.main: a1\n",
+                "03/11/21 08:51:01 INFO    :.main: a2\n",
+            ],
+        )
+        stderr = io.StringIO()
+
+        with redirect_stderr(stderr), self.assertRaises(SystemExit) as context:
+            main(["logs", host_a])
+
+        self.assertEqual(context.exception.code, 1)
+        self.assertIn("error: Log file", stderr.getvalue())
+        self.assertIn("not in time order at line 2", stderr.getvalue())
+
+    def test_invalid_time_exits_cleanly_with_timing(self):
+        stderr = io.StringIO()
+
+        with redirect_stderr(stderr), self.assertRaises(SystemExit) as context:
+            main(["--timing", "time", "12:34"])
+
+        self.assertEqual(context.exception.code, 1)
+        self.assertIn("Elapsed:", stderr.getvalue())
+        self.assertIn("error: Invalid time format", stderr.getvalue())
+
+    def test_timing_and_trace_malloc_go_to_stderr(self):
+        stdout, stderr = self.run_main(
+            ["--timing", "--trace-malloc", "time", "01:02:03"]
+        )
+
+        self.assertEqual(stdout, "6\n")
+        self.assertIn("Elapsed:", stderr)
+        self.assertIn("peak", stderr)
+
+    def test_profile_printed_to_stderr(self):
+        stdout, stderr = self.run_main(["--profile", "time", "01:02:03"])
+
+        self.assertEqual(stdout, "6\n")
+        self.assertIn("sum_current_time", stderr)
+
+    def test_bad_profile_sort_key_rejected(self):
+        with self.assertRaises(SystemExit):
+            self.run_main(
+                ["--profile", "--profile-sort", "bogus", "time", "01:02:03"]
+            )
+
+    def test_profile_written_to_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            profile_file = os.path.join(tmp_dir, "out.prof")
+
+            self.run_main(["--profile-output", profile_file, "time", "01:02:03"])
+
+            stats = pstats.Stats(profile_file)
+            functions = [name for _, _, name in stats.stats]
+            self.assertIn("sum_current_time", functions)
+
+
+if __name__ == "__main__":
+    unittest.main()